@@ -297,30 +297,31 @@ class BannerFrame(Frame):
         disp_format = settings["format"]
         units = settings["units"]
 
-        self._update_time(**kwargs)
-        self._update_pos(disp_format, units, **kwargs)
-        self._update_track(units, **kwargs)
-        self._update_fix(**kwargs)
-        self._update_siv(**kwargs)
-        self._update_dop(units, **kwargs)
+        # pass the kwargs dict itself rather than re-expanding it per update
+        self._update_time(kwargs)
+        self._update_pos(disp_format, units, kwargs)
+        self._update_track(units, kwargs)
+        self._update_fix(kwargs)
+        self._update_siv(kwargs)
+        self._update_dop(units, kwargs)
 
-    def _update_time(self, **kwargs):
+    def _update_time(self, kwargs: dict):
         """
         Update GNSS time of week
 
-        :param kwargs: optional key value pairs
+        :param dict kwargs: optional key value pairs
         """
 
         if "time" in kwargs:
             self._time.set(kwargs["time"])
 
-    def _update_pos(self, disp_format, units, **kwargs):
+    def _update_pos(self, disp_format, units, kwargs: dict):
         """
         Update position
 
         :param str disp_format: degrees display format as string (DMS, DMM, DDD)
         :param str units: distance units as string (UMM, UMK, UI, UIK)
-        :param kwargs: optional key value pairs
+        :param dict kwargs: optional key value pairs
         """
 
         if "lat" in kwargs:
@@ -358,12 +359,12 @@ class BannerFrame(Frame):
                     self._alt.set(round(alt, 1))
                     self._alt_u.set("m")
 
-    def _update_track(self, units, **kwargs):
+    def _update_track(self, units, kwargs: dict):
         """
         Update track and ground speed
 
         :param str units: distance units as string (UMM, UMK, UI, UIK)
-        :param kwargs: optional key value pairs
+        :param dict kwargs: optional key value pairs
         """
 
         if "speed" in kwargs:
@@ -391,11 +392,11 @@ class BannerFrame(Frame):
             else:
                 self._track.set(str(round(track, 1)))
 
-    def _update_fix(self, **kwargs):
+    def _update_fix(self, kwargs: dict):
         """
         Update fix type
 
-        :param kwargs: optional key value pairs
+        :param dict kwargs: optional key value pairs
         """
 
         if "fix" in kwargs:
@@ -407,11 +408,11 @@ class BannerFrame(Frame):
                 self._lbl_fix.config(fg="red")
             self._fix.set(kwargs["fix"])
 
-    def _update_siv(self, **kwargs):
+    def _update_siv(self, kwargs: dict):
         """
         Update siv and sip
 
-        :param kwargs: optional key value pairs
+        :param dict kwargs: optional key value pairs
         """
 
         if "siv" in kwargs:
@@ -419,12 +420,12 @@ class BannerFrame(Frame):
         if "sip" in kwargs:
             self._sip.set(str(kwargs["sip"]).zfill(2))
 
-    def _update_dop(self, units, **kwargs):
+    def _update_dop(self, units, kwargs: dict):
         """
         Update precision and accuracy
 
         :param str units: distance units as string (UMM, UMK, UI, UIK)
-        :param kwargs: optional key value pairs
+        :param dict kwargs: optional key value pairs
         """
 
         if "dop" in kwargs:
@@ -9,9 +9,10 @@ Created on 12 Sep 2020
 """
 # pylint: disable=invalid-name, too-many-instance-attributes, too-many-ancestors
 
+from collections import deque
 from tkinter import Frame, Text, Scrollbar, S, E, W, END, HORIZONTAL, VERTICAL, N
 
-from .globals import TAGS, BGCOL, FGCOL
+from .globals import TAGS, BGCOL, FGCOL, CONSOLE_BUFFER, CONSOLE_FLUSH_INTERVAL
 
 
 class ConsoleFrame(Frame):
@@ -32,9 +33,11 @@ class ConsoleFrame(Frame):
         Frame.__init__(self, self.__master, *args, **kwargs)
 
         self.width, self.height = self.get_size()
+        self._pending = deque(maxlen=CONSOLE_BUFFER)
         self._body()
         self._do_layout()
         self._attach_events()
+        self.after(CONSOLE_FLUSH_INTERVAL, self._flush_console)
 
     def _body(self):
         """
@@ -78,34 +81,63 @@ class ConsoleFrame(Frame):
         """
 
         self.bind("<Configure>", self._on_resize)
+        self.bind("<Map>", lambda event: self._set_visible(True))
+        self.bind("<Unmap>", lambda event: self._set_visible(False))
+
+    def _set_visible(self, visible: bool):
+        """
+        Tell the protocol handlers whether the console is currently
+        displayed, so they don't format data nobody can see.
+
+        :param bool visible: console frame is mapped
+        """
+
+        self.__app.nmea_handler.set_console_visible(visible)
+        self.__app.ubx_handler.set_console_visible(visible)
 
     def update_console(self, data):
         """
-        Print the latest data stream to the console in raw (NMEA) or
-        parsed (key,value pair) format.
+        Queue the latest data stream for printing to the console in raw
+        (NMEA) or parsed (key,value pair) format.
 
-        'maxlines' defines the maximum number of scrollable lines that are
-        retained in the text box on a FIFO basis.
+        The queue is flushed to the text box every CONSOLE_FLUSH_INTERVAL ms,
+        so widget redraws don't run at the incoming message rate. If the
+        queue fills up between flushes, the oldest lines are dropped.
 
         :param str data
         """
 
-        settings = self.__app.frm_settings.get_settings()
-        con = self.txt_console
-        con.configure(state="normal")
-        con.insert(END, data + "\n")
+        self._pending.append(data)
+
+    def _flush_console(self):
+        """
+        Print any queued data to the console and reschedule.
+
+        'maxlines' defines the maximum number of scrollable lines that are
+        retained in the text box on a FIFO basis.
+        """
+
+        if self._pending:
+            settings = self.__app.frm_settings.get_settings()
+            con = self.txt_console
+            con.configure(state="normal")
+            while self._pending:
+                data = self._pending.popleft()
+                con.insert(END, data + "\n")
+
+                # format of this array of tuples is (tag, highlight color)
+                self._tag_line(data, TAGS)
 
-        # format of this array of tuples is (tag, highlight color)
-        self._tag_line(data, TAGS)
+            idx = int(float(con.index("end")))  # Lazy but it works
+            if idx > settings["maxlines"]:
+                # Remember these look like floats but they're not!
+                con.delete("1.0", f"{idx - settings['maxlines'] + 1}.0")
 
-        idx = float(con.index("end"))  # Lazy but it works
-        if idx > settings["maxlines"]:
-            con.delete("1.0", "2.0")  # Remember these look like floats but they're not!
+            if settings["autoscroll"]:
+                con.see("end")
+            con.configure(state="disabled")
 
-        con.update()
-        if settings["autoscroll"]:
-            con.see("end")
-        con.configure(state="disabled")
+        self.after(CONSOLE_FLUSH_INTERVAL, self._flush_console)
 
     def _tag_line(self, line, tags):
         """
@@ -46,6 +46,8 @@ MAP_UPDATE_INTERVAL = (
     60  # how frequently the mapquest api is called to update the web map
 )
 SAT_EXPIRY = 10  # how long passed satellites are kept in the sky and graph views
+MAP_REFRESH_INTERVAL = 0.5  # minimum interval in seconds between map redraws
+PVT_EXPIRY = 2  # how long a NAV-PVT supersedes NAV-POSLLH position updates
 MAX_SNR = 60  # upper limit of graphview snr axis
 DEVICE_ACCURACY = 2.5  # nominal GPS device accuracy (CEP) in meters
 HDOP_RATIO = 20  # arbitrary calibration of accuracy against HDOP
@@ -65,9 +67,13 @@ PARITIES = {
 # serial port timeout; lower is better for app response
 # but you may lose packets on high latency connections
 SERIAL_TIMEOUT = 0.2
+DATA_QUEUE_SIZE = 1000  # maximum number of messages awaiting processing
+THREAD_STOP_TIMEOUT = 0.5  # seconds to wait for a reader thread to finish
 MQAPIKEY = "mqapikey"
 UBXPRESETS = "ubxpresets"
 MAXLOGLINES = 10000  # maximum number of 'lines' per datalog file
+CONSOLE_BUFFER = 500  # maximum number of lines awaiting display in console
+CONSOLE_FLUSH_INTERVAL = 200  # interval in ms between console refreshes
 NMEA_PROTOCOL = 0
 UBX_PROTOCOL = 1
 MIXED_PROTOCOL = 2
@@ -56,6 +56,7 @@ class MapviewFrame(Frame):
         self._img = None
         self._marker = None
         self._last_map_update = 0
+        self._webmap = self.__app.frm_settings.get_settings()["webmap"]
         self._body()
 
         self.bind("<Configure>", self._on_resize)
@@ -84,11 +85,6 @@ class MapviewFrame(Frame):
         w, h = self.width, self.height
         resize_font = font.Font(size=min(int(w / 20), 14))
 
-        if self.__app.frm_settings.get_settings()["webmap"]:
-            static = False
-        else:
-            static = True
-
         if lat is None or lat == "" or lon is None or lon == "":
             self.can_mapview.delete("all")
             self.reset_map_refresh()
@@ -108,12 +104,12 @@ class MapviewFrame(Frame):
             )
             return
 
-        if static:
-            self._draw_static_map(lat, lon)
-        else:
+        if self._webmap:
             if hacc is None or hacc == "":
                 hacc = 0
             self._draw_web_map(lat, lon, hacc)
+        else:
+            self._draw_static_map(lat, lon)
 
     def _draw_static_map(self, lat: float, lon: float):
         """
@@ -233,6 +229,15 @@ class MapviewFrame(Frame):
 
         return MAPURL.format(apikey, lat, lon, zoom, radius, lat, lon, w, h)
 
+    def set_webmap(self, webmap: bool):
+        """
+        Set map type (web or static).
+
+        :param bool webmap: use web map if True, else static world map
+        """
+
+        self._webmap = webmap
+
     def reset_map_refresh(self):
         """
         Reset map refresh counter to zero
@@ -60,6 +60,8 @@ class NMEAHandler:
         self.utc = ""
         self.sip = 0
         self.fix = "-"
+        self._raw_mode = False
+        self._console_visible = True
 
     def process_data(self, data: bytes):
         """
@@ -76,8 +78,7 @@ class NMEAHandler:
             # rarely so we ignore them and carry on.
             return None
 
-        if data or parsed_data:
-            self._update_console(data, parsed_data)
+        self._update_console(data, parsed_data)
 
         if isinstance(parsed_data, RMC):  # Recommended minimum data for GPS
             self._process_RMC(parsed_data)
@@ -98,15 +99,37 @@ class NMEAHandler:
 
         return self._parsed_data
 
+    def set_raw(self, raw: bool):
+        """
+        Set console display mode.
+
+        :param bool raw: display raw data if True, else parsed data
+        """
+
+        self._raw_mode = raw
+
+    def set_console_visible(self, visible: bool):
+        """
+        Set console visibility.
+
+        :param bool visible: console is displayed if True
+        """
+
+        self._console_visible = visible
+
     def _update_console(self, raw_data: bytes, parsed_data: types.talker):
         """
         Write the incoming data to the console in raw or parsed format.
 
+        Does nothing if the console is hidden.
+
         :param bytes raw_data: raw data
         :param pynmea2.types.talker parsed_data: parsed data
         """
 
-        if self.__app.frm_settings.get_settings()["raw"]:
+        if not self._console_visible:
+            return
+        if self._raw_mode:
             self.__app.frm_console.update_console(repr(raw_data))
         else:
             self.__app.frm_console.update_console(repr(parsed_data))
@@ -2,7 +2,11 @@
 SerialHandler class for PyGPSClient application
 
 This handles all the serial i/o , threaded read process and direction to
-the appropriate protocol handler
+the appropriate protocol handler.
+
+The read threads do all the blocking i/o and split the incoming stream into
+individual NMEA or UBX messages, which are passed to the tkinter main loop
+via a queue for parsing and display.
 
 Created on 16 Sep 2020
 
@@ -10,7 +14,8 @@ Created on 16 Sep 2020
 """
 
 from io import BufferedReader
-from threading import Thread
+from queue import Queue, Empty, Full
+from threading import Thread, Event
 
 from serial import Serial, SerialException, SerialTimeoutException
 
@@ -25,9 +30,13 @@ from .globals import (
     MIXED_PROTOCOL,
     UBX_PROTOCOL,
     PARITIES,
+    DATA_QUEUE_SIZE,
+    THREAD_STOP_TIMEOUT,
 )
 from .strings import STOPDATA, NOTCONN, SEROPENERROR, ENDOFFILE
 
+EOF = -1  # _read_message return value at end of datalog file
+
 
 class SerialHandler:
     """
@@ -54,6 +63,9 @@ class SerialHandler:
         self._recordtrack = False
         self._port = None
         self._reading = False
+        self._stop_event = None  # set to stop the current reader thread
+        # (protocol, raw data) messages awaiting processing in the main loop
+        self._data_queue = Queue(maxsize=DATA_QUEUE_SIZE)
 
     def __del__(self):
         """
@@ -154,7 +166,7 @@ class SerialHandler:
 
         if self._connected:
             try:
-                self._reading = False
+                self._stop_thread()
                 self._serial_object.close()
                 self.__app.frm_banner.update_conn_status(DISCONNECTED)
                 self.__app.set_connection(NOTCONN, "red")
@@ -232,7 +244,13 @@ class SerialHandler:
         if self._connected:
             self._reading = True
             self.__app.frm_mapview.reset_map_refresh()
-            self._serial_thread = Thread(target=self._read_thread, daemon=True)
+            self._data_queue = Queue(maxsize=DATA_QUEUE_SIZE)
+            self._stop_event = Event()
+            self._serial_thread = Thread(
+                target=self._read_thread,
+                args=(self._serial_buffer, self._data_queue, self._stop_event),
+                daemon=True,
+            )
             self._serial_thread.start()
 
     def start_readfile_thread(self):
@@ -243,7 +261,13 @@ class SerialHandler:
         if self._connected:
             self._reading = True
             self.__app.frm_mapview.reset_map_refresh()
-            self._file_thread = Thread(target=self._readfile_thread, daemon=True)
+            self._data_queue = Queue(maxsize=DATA_QUEUE_SIZE)
+            self._stop_event = Event()
+            self._file_thread = Thread(
+                target=self._readfile_thread,
+                args=(self._serial_buffer, self._data_queue, self._stop_event),
+                daemon=True,
+            )
             self._file_thread.start()
 
     def stop_read_thread(self):
@@ -252,8 +276,7 @@ class SerialHandler:
         """
 
         if self._serial_thread is not None:
-            self._reading = False
-            self._serial_thread = None
+            self._stop_thread()
             self.__app.set_status(STOPDATA, "red")
 
     def stop_readfile_thread(self):
@@ -262,53 +285,140 @@ class SerialHandler:
         """
 
         if self._file_thread is not None:
-            self._reading = False
-            self._file_thread = None
+            self._stop_thread()
             self.__app.set_status(STOPDATA, "red")
 
-    def _read_thread(self):
+    def _stop_thread(self):
+        """
+        Signal the current reader thread to stop, interrupt any blocking
+        serial read and wait for the thread to finish.
+
+        The wait is bounded, as the thread may itself be waiting on the main
+        loop to process a virtual event. A thread which outlives the wait is
+        harmless - it only uses its own buffer, queue and stop event, and
+        exits as soon as it next checks the event.
+        """
+
+        self._reading = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._serial_thread is not None and self._serial_object.is_open:
+            self._serial_object.cancel_read()  # interrupt a blocking serial read
+        for thread in (self._serial_thread, self._file_thread):
+            if thread is not None:
+                thread.join(THREAD_STOP_TIMEOUT)
+        self._serial_thread = None
+        self._file_thread = None
+
+    def _read_thread(self, ser: BufferedReader, data_queue: Queue, stop: Event):
         """
         THREADED PROCESS
-        Reads binary data from serial port and generates virtual event to
-        trigger data parsing and widget updates.
+        Reads binary data from serial port, queues each complete message and
+        generates virtual event to trigger data parsing and widget updates.
+
+        All blocking serial i/o happens here so the tkinter main loop never
+        waits on the serial port.
+
+        :param BufferedReader ser: serial port buffer this thread reads from
+        :param Queue data_queue: queue this thread writes to
+        :param Event stop: set to stop this thread
         """
 
         try:
-            #         print("doing serial_handler._read_thread")
-            while self._reading and self._serial_object:
-                #             print("doing serial_handler._read_thread while loop")
-                if self._serial_object.in_waiting:
-                    #                 print(f"Bytes in buffer: {self._serial_object.in_waiting}")
-                    #                 print("doing serial_handler._read_thread in_waiting")
-                    self.__master.event_generate("<<ubx_read>>")
-        except SerialException as err:
-            self.__app.set_status(f"Error in read thread {err}", "red")
-
-    def _readfile_thread(self):
+            while not stop.is_set():
+                msg = self._read_message(ser)
+                if msg is not None:
+                    self._queue_message(msg, "<<ubx_read>>", data_queue, stop)
+        except (SerialException, ValueError) as err:
+            if not stop.is_set():  # otherwise port was closed on disconnect
+                self.__app.set_status(f"Error in read thread {err}", "red")
+
+    def _readfile_thread(self, ser: BufferedReader, data_queue: Queue, stop: Event):
         """
         THREADED PROCESS
-        Reads binary data from datalog file and generates virtual event to
-        trigger data parsing and widget updates.
+        Reads binary data from datalog file, queues each complete message and
+        generates virtual event to trigger data parsing and widget updates.
+
+        :param BufferedReader ser: datalog file buffer this thread reads from
+        :param Queue data_queue: queue this thread writes to
+        :param Event stop: set to stop this thread
+        """
+
+        while not stop.is_set():
+            try:
+                msg = self._read_message(ser, True)
+            except ValueError:  # file closed on disconnect
+                break
+            if msg == EOF:
+                # queued rather than processed immediately, so this thread
+                # has exited by the time on_eof waits for it
+                self.__master.event_generate("<<ubx_eof>>", when="tail")
+                break
+            if msg is not None:
+                self._queue_message(msg, "<<ubx_readfile>>", data_queue, stop)
+
+    def _queue_message(self, msg: tuple, event: str, data_queue: Queue, stop: Event):
+        """
+        Add message to the data queue and generate virtual event to
+        trigger processing. If the queue is full (i.e. the main loop is
+        falling behind), wait for it to drain.
+
+        :param tuple msg: (protocol, raw data)
+        :param str event: virtual event to generate
+        :param Queue data_queue: queue to add message to
+        :param Event stop: set if reader thread is stopping
+        """
+
+        while not stop.is_set():
+            try:
+                data_queue.put(msg, timeout=SERIAL_TIMEOUT)
+                self.__master.event_generate(event)
+                return
+            except Full:
+                continue
+
+    def _read_message(self, ser: Serial, isfile: bool = False):
+        """
+        Read the binary data and identify a single UBX or NMEA message.
+
+        :param Serial ser: serial port (or datalog file) buffer
+        :param bool isfile: True if reading from datalog file
+        :return (protocol, raw data), EOF if file is exhausted, or
+            None if no recognised message was read
+        :rtype: tuple
         """
 
-        #         print("doing serial_handler._readfile_thread")
-        while self._reading and self._serial_object:
-            #             print("doing serial_handler._readfile_thread while loop")
-            self.__master.event_generate("<<ubx_readfile>>")
+        byte1 = ser.read(2)  # read first two bytes to determine protocol
+        if len(byte1) < 2:
+            return EOF if isfile else None
+
+        # if it's a UBX message (b'\b5\x62')
+        if byte1 == ubt.UBX_HDR:
+            byten = ser.read(4)
+            if len(byten) < 4:
+                return EOF if isfile else None
+            lenb = byten[2:4]
+            leni = int.from_bytes(lenb, "little", signed=False)
+            plb = ser.read(leni + 2)  # payload + checksum
+            if len(plb) < leni + 2:
+                return EOF if isfile else None
+            return (UBX_PROTOCOL, byte1 + byten + plb)
+        # if it's an NMEA message ('$G' or '$P')
+        if byte1 in (b"\x24\x47", b"\x24\x50"):
+            return (NMEA_PROTOCOL, byte1 + ser.readline())
+        # else drop it like it's hot
+        return None
 
     def on_read(self, event):  # pylint: disable=unused-argument
         """
-        Action on <<ubx_read>> event - read any data in the buffer.
+        Action on <<ubx_read>> or <<ubx_readfile>> event - process any
+        queued messages.
 
         :param event
         """
 
-        #         print("doing serial_handler.on_read")
         if self._reading and self._serial_object is not None:
-            try:
-                self._parse_data(self._serial_buffer)
-            except SerialException as err:
-                self.__app.set_status(f"Error {err}", "red")
+            self._process_queue()
 
     def on_eof(self, event):  # pylint: disable=unused-argument
         """
@@ -321,67 +431,34 @@ class SerialHandler:
         self.disconnect()
         self.__app.set_status(ENDOFFILE, "blue")
 
-    def _parse_data(self, ser: Serial):
+    def _process_queue(self):
         """
-        Read the binary data and direct to the appropriate
-        UBX and/or NMEA protocol handler, depending on which protocols
-        are filtered.
+        Direct any queued messages to the appropriate UBX and/or NMEA
+        protocol handler, depending on which protocols are filtered.
 
-        :param Serial ser: serial port
+        Only the messages already queued when called are processed, so
+        a fast reader can't starve the main loop.
         """
 
-        #         print("doing serial_handler_parse_data")
-        parsing = True
-        raw_data = None
-        byte1 = ser.read(2)  # read first two bytes to determine protocol
-        if len(byte1) < 2:
-            self.__master.event_generate("<<ubx_eof>>")
-            return
-
-        while parsing:
-            filt = self.__app.frm_settings.get_settings()["protocol"]
-            # if it's a UBX message (b'\b5\x62')
-            if byte1 == ubt.UBX_HDR and filt in (UBX_PROTOCOL, MIXED_PROTOCOL):
-                #                 print(f"doing serial_handler._parse_data if ubx {ser.peek()}")
-                byten = ser.read(4)
-                if len(byten) < 4:
-                    self.__master.event_generate("<<ubx_eof>>")
-                    parsing = False
-                    break
-                clsid = byten[0:1]
-                msgid = byten[1:2]
-                lenb = byten[2:4]
-                leni = int.from_bytes(lenb, "little", signed=False)
-                byten = ser.read(leni + 2)
-                if len(byten) < leni + 2:
-                    self.__master.event_generate("<<ubx_eof>>")
-                    parsing = False
-                    break
-                plb = byten[0:leni]
-                cksum = byten[leni : leni + 2]
-                raw_data = ubt.UBX_HDR + clsid + msgid + lenb + plb + cksum
+        filt = self.__app.frm_settings.get_settings()["protocol"]
+        for _ in range(self._data_queue.qsize()):
+            try:
+                protocol, raw_data = self._data_queue.get_nowait()
+            except Empty:
+                break
+            if protocol == UBX_PROTOCOL and filt in (UBX_PROTOCOL, MIXED_PROTOCOL):
                 self.__app.ubx_handler.process_data(raw_data)
-                parsing = False
-            # if it's an NMEA message ('$G' or '$P')
-            elif byte1 in (b"\x24\x47", b"\x24\x50") and filt in (
-                NMEA_PROTOCOL,
-                MIXED_PROTOCOL,
-            ):
-                #                 print(f"doing serial_handler._parse_data if nmea {ser.peek()}")
+            elif protocol == NMEA_PROTOCOL and filt in (NMEA_PROTOCOL, MIXED_PROTOCOL):
                 try:
-                    raw_data = byte1 + ser.readline()
                     self.__app.nmea_handler.process_data(raw_data.decode("utf-8"))
                 except UnicodeDecodeError:
                     continue
-                parsing = False
-            # else drop it like it's hot
             else:
-                #                 print(f"dropping {ser.peek()}")
-                parsing = False
+                continue
 
-        # if datalogging, write to log file
-        if self._datalogging and raw_data is not None:
-            self.__app.file_handler.write_logfile(raw_data)
+            # if datalogging, write to log file
+            if self._datalogging:
+                self.__app.file_handler.write_logfile(raw_data)
 
     def flush(self):
         """
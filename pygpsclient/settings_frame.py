@@ -160,10 +160,18 @@ class SettingsFrame(Frame):
         )
         self._lbl_consoledisplay = Label(self._frm_options, text=LBLDATADISP)
         self._rad_parsed = Radiobutton(
-            self._frm_options, text="Parsed", variable=self._raw, value=0
+            self._frm_options,
+            text="Parsed",
+            variable=self._raw,
+            value=0,
+            command=lambda: self._on_raw(),
         )
         self._rad_raw = Radiobutton(
-            self._frm_options, text="Raw", variable=self._raw, value=1
+            self._frm_options,
+            text="Raw",
+            variable=self._raw,
+            value=1,
+            command=lambda: self._on_raw(),
         )
         self._lbl_format = Label(self._frm_options, text="Degrees Format")
         self._spn_format = Spinbox(
@@ -302,11 +310,21 @@ class SettingsFrame(Frame):
 
         self.__app.ubxconfig()
 
+    def _on_raw(self):
+        """
+        Pass console display mode (raw or parsed) to protocol handlers
+        """
+
+        raw = self._raw.get()
+        self.__app.nmea_handler.set_raw(raw)
+        self.__app.ubx_handler.set_raw(raw)
+
     def _on_webmap(self):
         """
-        Reset webmap refresh timer
+        Pass web map setting to map view and reset webmap refresh timer
         """
 
+        self.__app.frm_mapview.set_webmap(self._webmap.get())
         self.__app.frm_mapview.reset_map_refresh()
 
     def _on_data_log(self):
@@ -366,6 +384,7 @@ class SettingsFrame(Frame):
         self._autoscroll.set(1)
         self._maxlines.set(300)
         self._raw.set(False)
+        self._on_raw()
         self._webmap.set(False)
         self._mapzoom.set(10)
         self._show_legend.set(True)
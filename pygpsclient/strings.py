@@ -31,6 +31,7 @@ SAVEERROR = "ERROR! File could not be saved to specified directory"
 OPENFILEERROR = "ERROR! File could not be opened"
 BADJSONERROR = "ERROR! Invalid metadata file"
 NMEAVALERROR = "Value error in NMEA message: {}"
+UBXVALERROR = "Value error in UBX message: {}"
 SEROPENERROR = "Error opening serial port {}"
 NOWEBMAPERROR1 = "Map not available."
 NOWEBMAPERROR2 = "mqapikey file not found or invalid."
@@ -10,20 +10,79 @@ Created on 30 Sep 2020
 # pylint: disable=invalid-name
 
 from datetime import datetime
+from struct import Struct
+from time import monotonic
 from pyubx2 import UBXMessage, UBX_MSGIDS, UBX_CONFIG_MESSAGES
 from pyubx2.ubxhelpers import itow2utc, gpsfix2str
-from .globals import svid2gnssid, GLONASS_NMEA
+from .globals import (
+    svid2gnssid,
+    GLONASS_NMEA,
+    MAP_REFRESH_INTERVAL,
+    PVT_EXPIRY,
+)
+from .strings import UBXVALERROR
+
+ubx_parse = UBXMessage.parse  # bound once rather than looked up per message
 
 BOTH = 3
 UBX = 1
 NMEA = 2
 
+# repeating group attribute suffixes ("_01", "_02", ...) indexed from zero;
+# group counts are U1 so there can be no more than 255 repeats
+GROUP_SUFFIX = tuple(f"_{i:02d}" for i in range(1, 256))
+
+# NAV-SVINFO repeating channel block (chn, svid, flags, quality, cno, elev,
+# azim, prRes) following the 8 byte header, unpacked to (svid, cno, elev, azim)
+SVINFO_HDR = 8
+SVINFO_CHANNEL = Struct("<xBxxBbh4x")
+
+# UBX message identities keyed on integer (msgClass << 8 | msgID), so that
+# messages which refer to other messages by class and ID can look them up
+# without converting and concatenating bytes. Only the 2 byte keys are used;
+# the 3 byte (class, ID, subtype) keys would collide with each other
+MSGIDS_INT = {k[0] << 8 | k[1]: v for k, v in UBX_MSGIDS.items() if len(k) == 2}
+CONFIG_MESSAGES_INT = {k[0] << 8 | k[1]: v for k, v in UBX_CONFIG_MESSAGES.items()}
+
 
 class UBXHandler:
     """
     UBXHandler class
     """
 
+    # Fixed attribute set; private names must be listed in mangled form
+    __slots__ = (
+        "_UBXHandler__app",
+        "_UBXHandler__master",
+        "_raw_data",
+        "_parsed_data",
+        "_record_track",
+        "_raw_mode",
+        "_console_visible",
+        "_last_map_redraw",
+        "_last_pvt",
+        "_dispatch",
+        "_handled",
+        "gsv_data",
+        "lon",
+        "lat",
+        "alt",
+        "track",
+        "speed",
+        "pdop",
+        "hdop",
+        "vdop",
+        "hacc",
+        "vacc",
+        "utc",
+        "sip",
+        "fix",
+        "ubx_portid",
+        "ubx_baudrate",
+        "ubx_inprot",
+        "ubx_outprot",
+    )
+
     def __init__(self, app):
         """
         Constructor.
@@ -53,66 +112,101 @@ class UBXHandler:
         self.utc = ""
         self.sip = 0
         self.fix = "-"
+        self._raw_mode = False
+        self._console_visible = True
+        self._last_map_redraw = 0
+        self._last_pvt = 0
         self.ubx_portid = 3  # USB
         self.ubx_baudrate = 9600
         self.ubx_inprot = 7
         self.ubx_outprot = 3
 
+        # Map of UBX message identity to processing method
+        self._dispatch = {
+            "ACK-ACK": self._process_ACK_ACK,
+            "ACK-NAK": self._process_ACK_NAK,
+            "CFG-MSG": self._process_CFG_MSG,
+            "CFG-PRT": self._process_CFG_PRT,
+            "CFG-INF": self._process_CFG_INF,
+            "CFG-VALGET": self._process_CFG_VALGET,
+            "NAV-POSLLH": self._process_NAV_POSLLH,
+            "NAV-PVT": self._process_NAV_PVT,
+            "NAV-VELNED": self._process_NAV_VELNED,
+            "NAV-SAT": self._process_NAV_SAT,
+            "NAV-SVINFO": self._process_NAV_SVINFO,
+            "NAV-SOL": self._process_NAV_SOL,
+            "NAV-DOP": self._process_NAV_DOP,
+            "MON-VER": self._process_MON_VER,
+            "MON-HW": self._process_MON_HW,
+        }
+        # Class & ID bytes of the message types which have a processing method
+        self._handled = {
+            msgid
+            for msgid, identity in UBX_MSGIDS.items()
+            if identity in self._dispatch
+        }
+
     def process_data(self, data: bytes) -> UBXMessage:
         """
         Process UBX message type
 
+        If the message type has no processing method and the console is
+        either hidden or displaying raw data, the message is not parsed at all.
+
         :param bytes data: raw data
-        :return UBXMessage:
+        :return UBXMessage (or None if the message wasn't parsed):
         :rtype: UBXMessage
         """
 
-        parsed_data = UBXMessage.parse(data, False)
-
-        if parsed_data.identity == "ACK-ACK":
-            self._process_ACK_ACK(parsed_data)
-        if parsed_data.identity == "ACK-NAK":
-            self._process_ACK_NAK(parsed_data)
-        if parsed_data.identity == "CFG-MSG":
-            self._process_CFG_MSG(parsed_data)
-        if parsed_data.identity == "CFG-PRT":
-            self._process_CFG_PRT(parsed_data)
-        if parsed_data.identity == "CFG-INF":
-            self._process_CFG_INF(parsed_data)
-        if parsed_data.identity == "CFG-VALGET":
-            self._process_CFG_VALGET(parsed_data)
-        if parsed_data.identity == "NAV-POSLLH":
-            self._process_NAV_POSLLH(parsed_data)
-        if parsed_data.identity == "NAV-PVT":
-            self._process_NAV_PVT(parsed_data)
-        if parsed_data.identity == "NAV-VELNED":
-            self._process_NAV_VELNED(parsed_data)
-        if parsed_data.identity == "NAV-SAT":
-            self._process_NAV_SAT(parsed_data)
-        if parsed_data.identity == "NAV-SVINFO":
-            self._process_NAV_SVINFO(parsed_data)
-        if parsed_data.identity == "NAV-SOL":
-            self._process_NAV_SOL(parsed_data)
-        if parsed_data.identity == "NAV-DOP":
-            self._process_NAV_DOP(parsed_data)
-        if parsed_data.identity == "MON-VER":
-            self._process_MON_VER(parsed_data)
-        if parsed_data.identity == "MON-HW":
-            self._process_MON_HW(parsed_data)
-        if data or parsed_data:
-            self._update_console(data, parsed_data)
+        # class & ID bytes follow the 2 byte header
+        unhandled = data[2:4] not in self._handled
+        if unhandled and (self._raw_mode or not self._console_visible):
+            self._update_console(data, None)
+            return None
+
+        parsed_data = ubx_parse(data, False)
+
+        handler = self._dispatch.get(parsed_data.identity, None)
+        if handler is not None:
+            try:
+                handler(parsed_data)
+            except (ValueError, AttributeError) as err:
+                self.__app.set_status(UBXVALERROR.format(err), "red")
+        self._update_console(data, parsed_data)
 
         return parsed_data
 
+    def set_raw(self, raw: bool):
+        """
+        Set console display mode.
+
+        :param bool raw: display raw data if True, else parsed data
+        """
+
+        self._raw_mode = raw
+
+    def set_console_visible(self, visible: bool):
+        """
+        Set console visibility.
+
+        :param bool visible: console is displayed if True
+        """
+
+        self._console_visible = visible
+
     def _update_console(self, raw_data: bytes, parsed_data: UBXMessage):
         """
         Write the incoming data to the console in raw or parsed format.
 
+        Does nothing if the console is hidden.
+
         :param bytes raw_data: raw data
         :param UBXMessage parsed_data: UBXMessage
         """
 
-        if self.__app.frm_settings.get_settings()["raw"]:
+        if not self._console_visible:
+            return
+        if self._raw_mode:
             self.__app.frm_console.update_console(str(raw_data))
         else:
             self.__app.frm_console.update_console(str(parsed_data))
@@ -124,12 +218,10 @@ class UBXHandler:
         :param UBXMessage data: ACK_ACK parsed message
         """
 
-        (ubxClass, ubxID) = UBXMessage.msgclass2bytes(data.clsID, data.msgID)
-
         # update the UBX config panel
         if self.__app.dlg_ubxconfig is not None:
             self.__app.dlg_ubxconfig.update_pending(
-                "ACK-ACK", msgtype=UBX_MSGIDS[ubxClass + ubxID]
+                "ACK-ACK", msgtype=MSGIDS_INT[data.clsID << 8 | data.msgID]
             )
 
     def _process_ACK_NAK(self, data: UBXMessage):
@@ -139,12 +231,10 @@ class UBXHandler:
         :param UBXMessage data: ACK_NAK parsed message
         """
 
-        (ubxClass, ubxID) = UBXMessage.msgclass2bytes(data.clsID, data.msgID)
-
         # update the UBX config panel
         if self.__app.dlg_ubxconfig is not None:
             self.__app.dlg_ubxconfig.update_pending(
-                "ACK-NAK", msgtype=UBX_MSGIDS[ubxClass + ubxID]
+                "ACK-NAK", msgtype=MSGIDS_INT[data.clsID << 8 | data.msgID]
             )
 
     def _process_CFG_MSG(self, data: UBXMessage):
@@ -154,24 +244,16 @@ class UBXHandler:
         :param UBXMessage data: CFG-MSG parsed message
         """
 
-        (ubxClass, ubxID) = UBXMessage.msgclass2bytes(data.msgClass, data.msgID)
-
-        ddcrate = data.rateDDC
-        uart1rate = data.rateUART1
-        uart2rate = data.rateUART2
-        usbrate = data.rateUSB
-        spirate = data.rateSPI
-
         # update the UBX config panel
         if self.__app.dlg_ubxconfig is not None:
             self.__app.dlg_ubxconfig.update_pending(
                 "CFG-MSG",
-                msgtype=UBX_CONFIG_MESSAGES[ubxClass + ubxID],
-                ddcrate=ddcrate,
-                uart1rate=uart1rate,
-                uart2rate=uart2rate,
-                usbrate=usbrate,
-                spirate=spirate,
+                msgtype=CONFIG_MESSAGES_INT[data.msgClass << 8 | data.msgID],
+                ddcrate=data.rateDDC,
+                uart1rate=data.rateUART1,
+                uart2rate=data.rateUART2,
+                usbrate=data.rateUSB,
+                spirate=data.rateSPI,
             )
 
     def _process_CFG_INF(self, data: UBXMessage):  # pylint: disable=unused-argument
@@ -192,21 +274,19 @@ class UBXHandler:
         :param UBXMessage data: CFG-PRT parsed message
         """
 
-        self.ubx_portid = data.portID
-        self.ubx_baudrate = data.baudRate
-        #         self.ubx_inprot = int.from_bytes(data.inProtoMask, "little", signed=False)
-        #         self.ubx_outprot = int.from_bytes(data.outProtoMask, "little", signed=False)
-        self.ubx_inprot = data.inProtoMask
-        self.ubx_outprot = data.outProtoMask
+        self.ubx_portid = portid = data.portID
+        self.ubx_baudrate = baudrate = data.baudRate
+        self.ubx_inprot = inprot = data.inProtoMask
+        self.ubx_outprot = outprot = data.outProtoMask
 
         # update the UBX config panel
         if self.__app.dlg_ubxconfig is not None:
             self.__app.dlg_ubxconfig.update_pending(
                 "CFG-PRT",
-                portid=self.ubx_portid,
-                baudrate=self.ubx_baudrate,
-                inprot=self.ubx_inprot,
-                outprot=self.ubx_outprot,
+                portid=portid,
+                baudrate=baudrate,
+                inprot=inprot,
+                outprot=outprot,
             )
 
     def _process_CFG_VALGET(self, data: UBXMessage):  # pylint: disable=unused-argument
@@ -230,27 +310,12 @@ class UBXHandler:
         :param UBXMessage data: NAV-POSLLH parsed message
         """
 
-        try:
-            self.utc = itow2utc(data.iTOW)
-            self.lat = data.lat / 10 ** 7
-            self.lon = data.lon / 10 ** 7
-            self.alt = data.hMSL / 1000
-            self.hacc = data.hAcc / 1000
-            self.vacc = data.vAcc / 1000
-            self.__app.frm_banner.update_banner(
-                time=self.utc,
-                lat=self.lat,
-                lon=self.lon,
-                alt=self.alt,
-                hacc=self.hacc,
-                vacc=self.vacc,
-            )
+        # NAV-PVT is a superset of NAV-POSLLH, so if both are enabled
+        # there's no point updating the banner and map twice per epoch
+        if monotonic() - self._last_pvt < PVT_EXPIRY:
+            return
 
-            self.__app.frm_mapview.update_map(self.lat, self.lon, self.hacc)
-
-        except ValueError:
-            # self.__app.set_status(ube.UBXMessageError(err), "red")
-            pass
+        self._update_position(data)
 
     def _process_NAV_PVT(self, data: UBXMessage):
         """
@@ -259,18 +324,63 @@ class UBXHandler:
         :param UBXMessage data: NAV-PVT parsed message
         """
 
-        try:
-            self.utc = itow2utc(data.iTOW)
-            self.lat = data.lat / 10 ** 7
-            self.lon = data.lon / 10 ** 7
-            self.alt = data.hMSL / 1000
-            self.hacc = data.hAcc / 1000
-            self.vacc = data.vAcc / 1000
+        self._last_pvt = monotonic()
+        self._update_position(data, pvt=True)
+
+        if (
+            self.__app.frm_settings.get_settings()["recordtrack"]
+            and self.lat != ""
+            and self.lon != ""
+        ):
+            time = (
+                datetime(
+                    data.year,
+                    data.month,
+                    data.day,
+                    data.hour,
+                    data.min,
+                    data.second,
+                ).isoformat()
+                + "Z"
+            )
+            if self.fix == "3D":
+                fix = "3d"
+            elif self.fix == "2D":
+                fix = "2d"
+            else:
+                fix = "none"
+            self.__app.file_handler.add_trackpoint(
+                self.lat,
+                self.lon,
+                ele=self.alt,
+                time=time,
+                fix=fix,
+                sat=self.sip,
+                pdop=self.pdop,
+            )
+
+    def _update_position(self, data: UBXMessage, pvt: bool = False):
+        """
+        Update position, accuracy and (for NAV-PVT) fix, speed and track
+        from the fields common to NAV-POSLLH and NAV-PVT, then refresh
+        the banner and (at most every MAP_REFRESH_INTERVAL seconds) the map.
+
+        :param UBXMessage data: NAV-POSLLH or NAV-PVT parsed message
+        :param bool pvt: True if data is a NAV-PVT message
+        """
+
+        self.utc = itow2utc(data.iTOW)
+        self.lat = data.lat / 10 ** 7
+        self.lon = data.lon / 10 ** 7
+        self.alt = data.hMSL / 1000
+        self.hacc = data.hAcc / 1000
+        self.vacc = data.vAcc / 1000
+        if pvt:
             self.pdop = data.pDOP / 100
             self.sip = data.numSV
             self.speed = data.gSpeed / 1000  # m/s
             self.track = data.headMot / 10 ** 5
-            fix = gpsfix2str(data.fixType)
+            self.fix = gpsfix2str(data.fixType)
             self.__app.frm_banner.update_banner(
                 time=self.utc,
                 lat=self.lat,
@@ -281,47 +391,25 @@ class UBXHandler:
                 dop=self.pdop,
                 sip=self.sip,
                 speed=self.speed,
-                fix=fix,
+                fix=self.fix,
                 track=self.track,
             )
+        else:
+            self.__app.frm_banner.update_banner(
+                time=self.utc,
+                lat=self.lat,
+                lon=self.lon,
+                alt=self.alt,
+                hacc=self.hacc,
+                vacc=self.vacc,
+            )
 
+        # limit map redraws to decouple GUI refresh rate from navigation rate
+        now = monotonic()
+        if now - self._last_map_redraw >= MAP_REFRESH_INTERVAL:
+            self._last_map_redraw = now
             self.__app.frm_mapview.update_map(self.lat, self.lon, self.hacc)
 
-            if (
-                self.__app.frm_settings.get_settings()["recordtrack"]
-                and self.lat != ""
-                and self.lon != ""
-            ):
-                time = (
-                    datetime(
-                        data.year,
-                        data.month,
-                        data.day,
-                        data.hour,
-                        data.min,
-                        data.second,
-                    ).isoformat()
-                    + "Z"
-                )
-                if fix == "3D":
-                    fix = "3d"
-                elif fix == "2D":
-                    fix = "2d"
-                else:
-                    fix = "none"
-                self.__app.file_handler.add_trackpoint(
-                    self.lat,
-                    self.lon,
-                    ele=self.alt,
-                    time=time,
-                    fix=fix,
-                    sat=self.sip,
-                    pdop=self.pdop,
-                )
-        except ValueError:
-            # self.__app.set_status(ube.UBXMessageError(err), "red")
-            pass
-
     def _process_NAV_VELNED(self, data: UBXMessage):
         """
         Process NAV-VELNED sentence - Velocity Solution in North East Down format.
@@ -329,13 +417,9 @@ class UBXHandler:
         :param UBXMessage data: NAV-VELNED parsed message
         """
 
-        try:
-            self.track = data.heading / 10 ** 5
-            self.speed = data.gSpeed / 100  # m/s
-            self.__app.frm_banner.update_banner(speed=self.speed, track=self.track)
-        except ValueError:
-            # self.__app.set_status(ube.UBXMessageError(err), "red")
-            pass
+        self.track = data.heading / 10 ** 5
+        self.speed = data.gSpeed / 100  # m/s
+        self.__app.frm_banner.update_banner(speed=self.speed, track=self.track)
 
     def _process_NAV_SAT(self, data: UBXMessage):
         """
@@ -350,29 +434,33 @@ class UBXHandler:
         """
 
         show_zero = self.__app.frm_settings.get_settings()["zerosignal"]
-        try:
-            self.gsv_data = []
-            num_siv = int(data.numCh)
-
-            for i in range(num_siv):
-                idx = "_{0:0=2d}".format(i + 1)
-                gnssId = getattr(data, "gnssId" + idx)
-                svid = getattr(data, "svId" + idx)
-                # use NMEA GLONASS numbering (65-96) rather than slotID (1-24)
-                if gnssId == 6 and svid < 25 and svid != 255 and GLONASS_NMEA:
-                    svid += 64
-                elev = getattr(data, "elev" + idx)
-                azim = getattr(data, "azim" + idx)
-                cno = getattr(data, "cno" + idx)
-                if cno == 0 and not show_zero:  # omit sats with zero signal
-                    continue
-                self.gsv_data.append((gnssId, svid, elev, azim, cno))
-            self.__app.frm_banner.update_banner(siv=len(self.gsv_data))
-            self.__app.frm_satview.update_sats(self.gsv_data)
-            self.__app.frm_graphview.update_graph(self.gsv_data, len(self.gsv_data))
-        except ValueError:
-            # self.__app.set_status(ube.UBXMessageError(err), "red")
-            pass
+        gsv_data = self.gsv_data  # reused in place from epoch to epoch
+        size = len(gsv_data)
+        num_siv = data.numCh
+        n = 0
+
+        for i in range(num_siv):
+            idx = GROUP_SUFFIX[i]
+            gnssId = getattr(data, "gnssId" + idx)
+            svid = getattr(data, "svId" + idx)
+            # use NMEA GLONASS numbering (65-96) rather than slotID (1-24)
+            if gnssId == 6 and svid < 25 and svid != 255 and GLONASS_NMEA:
+                svid += 64
+            elev = getattr(data, "elev" + idx)
+            azim = getattr(data, "azim" + idx)
+            cno = getattr(data, "cno" + idx)
+            if cno == 0 and not show_zero:  # omit sats with zero signal
+                continue
+            sat = (gnssId, svid, elev, azim, cno)
+            if n < size:
+                gsv_data[n] = sat
+            else:
+                gsv_data.append(sat)
+            n += 1
+        del gsv_data[n:]
+        self.__app.frm_banner.update_banner(siv=n)
+        self.__app.frm_satview.update_sats(gsv_data)
+        self.__app.frm_graphview.update_graph(gsv_data, n)
 
     def _process_NAV_SVINFO(self, data: UBXMessage):
         """
@@ -384,26 +472,27 @@ class UBXHandler:
         """
 
         show_zero = self.__app.frm_settings.get_settings()["zerosignal"]
-        try:
-            self.gsv_data = []
-            num_siv = int(data.numCh)
-
-            for i in range(num_siv):
-                idx = "_{0:0=2d}".format(i + 1)
-                svid = getattr(data, "svid" + idx)
-                gnssId = svid2gnssid(svid)  # derive gnssId from svid
-                elev = getattr(data, "elev" + idx)
-                azim = getattr(data, "azim" + idx)
-                cno = getattr(data, "cno" + idx)
-                if cno == 0 and not show_zero:  # omit sats with zero signal
-                    continue
-                self.gsv_data.append((gnssId, svid, elev, azim, cno))
-            self.__app.frm_banner.update_banner(siv=len(self.gsv_data))
-            self.__app.frm_satview.update_sats(self.gsv_data)
-            self.__app.frm_graphview.update_graph(self.gsv_data, len(self.gsv_data))
-        except ValueError:
-            # self.__app.set_status(ube.UBXMessageError(err), "red")
-            pass
+        gsv_data = self.gsv_data  # reused in place from epoch to epoch
+        size = len(gsv_data)
+        num_siv = data.numCh
+        n = 0
+
+        # unpack the channel block directly rather than via getattr
+        channels = data.payload[SVINFO_HDR : SVINFO_HDR + num_siv * SVINFO_CHANNEL.size]
+        for svid, cno, elev, azim in SVINFO_CHANNEL.iter_unpack(channels):
+            gnssId = svid2gnssid(svid)  # derive gnssId from svid
+            if cno == 0 and not show_zero:  # omit sats with zero signal
+                continue
+            sat = (gnssId, svid, elev, azim, cno)
+            if n < size:
+                gsv_data[n] = sat
+            else:
+                gsv_data.append(sat)
+            n += 1
+        del gsv_data[n:]
+        self.__app.frm_banner.update_banner(siv=n)
+        self.__app.frm_satview.update_sats(gsv_data)
+        self.__app.frm_graphview.update_graph(gsv_data, n)
 
     def _process_NAV_SOL(self, data: UBXMessage):
         """
@@ -412,15 +501,11 @@ class UBXHandler:
         :param UBXMessage data: NAV-SOL parsed message
         """
 
-        try:
-            self.pdop = data.pDOP / 100
-            self.sip = data.numSV
-            fix = gpsfix2str(data.gpsFix)
+        self.pdop = data.pDOP / 100
+        self.sip = data.numSV
+        fix = gpsfix2str(data.gpsFix)
 
-            self.__app.frm_banner.update_banner(dop=self.pdop, fix=fix, sip=self.sip)
-        except ValueError:
-            # self.__app.set_status(ube.UBXMessageError(err), "red")
-            pass
+        self.__app.frm_banner.update_banner(dop=self.pdop, fix=fix, sip=self.sip)
 
     def _process_NAV_DOP(self, data: UBXMessage):
         """
@@ -429,17 +514,13 @@ class UBXHandler:
         :param UBXMessage data: NAV-DOP parsed message
         """
 
-        try:
-            self.pdop = data.pDOP / 100
-            self.hdop = data.hDOP / 100
-            self.vdop = data.vDOP / 100
+        self.pdop = data.pDOP / 100
+        self.hdop = data.hDOP / 100
+        self.vdop = data.vDOP / 100
 
-            self.__app.frm_banner.update_banner(
-                dop=self.pdop, hdop=self.hdop, vdop=self.vdop
-            )
-        except ValueError:
-            # self.__app.set_status(ube.UBXMessageError(err), "red")
-            pass
+        self.__app.frm_banner.update_banner(
+            dop=self.pdop, hdop=self.hdop, vdop=self.vdop
+        )
 
     def _process_MON_VER(self, data: UBXMessage):
         """
@@ -453,47 +534,42 @@ class UBXHandler:
         protocol = "n/a"
         gnss_supported = ""
 
-        try:
-            sw_version = (
-                getattr(data, "swVersion", "n/a").replace(b"\x00", b"").decode("utf-8")
-            )
-            sw_version = sw_version.replace("ROM CORE", "ROM")
-            sw_version = sw_version.replace("EXT CORE", "Flash")
-            hw_version = (
-                getattr(data, "hwVersion", "n/a").replace(b"\x00", b"").decode("utf-8")
+        sw_version = (
+            getattr(data, "swVersion", "n/a").replace(b"\x00", b"").decode("utf-8")
+        )
+        sw_version = sw_version.replace("ROM CORE", "ROM")
+        sw_version = sw_version.replace("EXT CORE", "Flash")
+        hw_version = (
+            getattr(data, "hwVersion", "n/a").replace(b"\x00", b"").decode("utf-8")
+        )
+
+        for i in range(9):
+            idx = GROUP_SUFFIX[i]
+            exts.append(
+                getattr(data, "extension" + idx, b"")
+                .replace(b"\x00", b"")
+                .decode("utf-8")
             )
+            if "FWVER=" in exts[i]:
+                fw_version = exts[i].replace("FWVER=", "")
+            if "PROTVER=" in exts[i]:
+                protocol = exts[i].replace("PROTVER=", "")
+            if "PROTVER " in exts[i]:
+                protocol = exts[i].replace("PROTVER ", "")
+            for gnss in ("GPS", "GLO", "GAL", "BDS", "SBAS", "IMES", "QZSS"):
+                if gnss in exts[i]:
+                    gnss_supported = gnss_supported + gnss + " "
 
-            for i in range(9):
-                idx = "_{0:0=2d}".format(i + 1)
-                exts.append(
-                    getattr(data, "extension" + idx, b"")
-                    .replace(b"\x00", b"")
-                    .decode("utf-8")
-                )
-                if "FWVER=" in exts[i]:
-                    fw_version = exts[i].replace("FWVER=", "")
-                if "PROTVER=" in exts[i]:
-                    protocol = exts[i].replace("PROTVER=", "")
-                if "PROTVER " in exts[i]:
-                    protocol = exts[i].replace("PROTVER ", "")
-                for gnss in ("GPS", "GLO", "GAL", "BDS", "SBAS", "IMES", "QZSS"):
-                    if gnss in exts[i]:
-                        gnss_supported = gnss_supported + gnss + " "
-
-            # update the UBX config panel
-            if self.__app.dlg_ubxconfig is not None:
-                self.__app.dlg_ubxconfig.update_pending(
-                    "MON-VER",
-                    swversion=sw_version,
-                    hwversion=hw_version,
-                    fwversion=fw_version,
-                    protocol=protocol,
-                    gnsssupported=gnss_supported,
-                )
-
-        except ValueError:
-            # self.__app.set_status(ube.UBXMessageError(err), "red")
-            pass
+        # update the UBX config panel
+        if self.__app.dlg_ubxconfig is not None:
+            self.__app.dlg_ubxconfig.update_pending(
+                "MON-VER",
+                swversion=sw_version,
+                hwversion=hw_version,
+                fwversion=fw_version,
+                protocol=protocol,
+                gnsssupported=gnss_supported,
+            )
 
     def _process_MON_HW(self, data: UBXMessage):
         """
@@ -87,6 +87,22 @@ PRESET_COMMMANDS = [
     PSTPOLLALL,
 ]
 
+# Poll messages are invariant, so serialize them once at import
+POLL_PRT = b"".join(
+    UBXMessage("CFG", "CFG-PRT", POLL, portID=portID).serialize()
+    for portID in range(5)
+)
+POLL_INF = b"".join(
+    UBXMessage("CFG", "CFG-INF", POLL, payload=payload).serialize()
+    for payload in (b"\x00", b"\x01")  # UBX & NMEA
+)
+POLL_ALL = b"".join(
+    UBXMessage("CFG", msgtype, POLL).serialize()
+    for msgtype in UBX_PAYLOADS_POLL
+    if msgtype[0:3] == "CFG"
+    and msgtype not in ("CFG-INF", "CFG-MSG", "CFG-PRT-IO", "CFG-TP5-TPX")
+)
+
 
 class UBX_PRESET_Frame(Frame):
     """
@@ -271,33 +287,21 @@ class UBX_PRESET_Frame(Frame):
         Poll INF message configuration.
         """
 
-        for msgtype in UBX_PAYLOADS_POLL:
-            if msgtype[0:3] == "CFG" and msgtype not in (
-                "CFG-INF",
-                "CFG-MSG",
-                "CFG-PRT-IO",
-                "CFG-TP5-TPX",
-            ):
-                msg = UBXMessage("CFG", msgtype, POLL)
-                self.__app.serial_handler.serial_write(msg.serialize())
+        self.__app.serial_handler.serial_write(POLL_ALL)
 
     def _do_poll_prt(self):
         """
         Poll PRT message configuration for each port.
         """
 
-        for portID in range(5):
-            msg = UBXMessage("CFG", "CFG-PRT", POLL, portID=portID)
-            self.__app.serial_handler.serial_write(msg.serialize())
+        self.__app.serial_handler.serial_write(POLL_PRT)
 
     def _do_poll_inf(self):
         """
         Poll INF message configuration.
         """
 
-        for payload in (b"\x00", b"\x01"):  # UBX & NMEA
-            msg = UBXMessage("CFG", "CFG-INF", POLL, payload=payload)
-            self.__app.serial_handler.serial_write(msg.serialize())
+        self.__app.serial_handler.serial_write(POLL_INF)
 
     def _do_set_inf(self, onoff: int):
         """
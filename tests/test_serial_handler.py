@@ -0,0 +1,57 @@
+'''
+Created on 14 Oct 2026
+
+Message framing tests for pygpsclient.serial_handler
+
+@author: semuadmin
+'''
+
+import unittest
+from io import BufferedReader, BytesIO
+from unittest.mock import MagicMock
+
+from pyubx2 import UBXMessage, GET
+
+from pygpsclient.globals import UBX_PROTOCOL, NMEA_PROTOCOL
+from pygpsclient.serial_handler import SerialHandler, EOF
+
+UBX = UBXMessage(b'\x01', b'\x30', GET, iTOW=403327000, numCh=1,
+                 svid_01=12, cno_01=38, elev_01=-5, azim_01=271).serialize()
+NMEA = b'$GPGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n'
+
+
+class SerialHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = SerialHandler(MagicMock())
+
+    def tearDown(self):
+        pass
+
+    def read(self, data, isfile=False):
+        return self.handler._read_message(BufferedReader(BytesIO(data)), isfile)
+
+    def testubx(self):
+        self.assertEqual(self.read(UBX), (UBX_PROTOCOL, UBX))
+
+    def testnmea(self):
+        self.assertEqual(self.read(NMEA + UBX), (NMEA_PROTOCOL, NMEA))
+
+    def testjunk(self):  # junk is dropped and the stream resyncs on the next message
+        ser = BufferedReader(BytesIO(b'\x00\xff\x12\x34' + UBX + NMEA))
+        res = [self.handler._read_message(ser) for _ in range(4)]
+        self.assertEqual(res, [None, None, (UBX_PROTOCOL, UBX), (NMEA_PROTOCOL, NMEA)])
+
+    def testtruncated(self):  # short header, length or payload
+        for data in (UBX[:1], UBX[:4], UBX[:-1]):
+            self.assertEqual(self.read(data, True), EOF)
+            self.assertIsNone(self.read(data, False))
+
+    def testempty(self):
+        self.assertEqual(self.read(b'', True), EOF)
+        self.assertIsNone(self.read(b''))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,48 @@
+'''
+Created on 14 Oct 2026
+
+Module level lookup table and payload layout tests for pygpsclient.ubx_handler
+
+@author: semuadmin
+'''
+
+import unittest
+
+from pyubx2 import UBXMessage, GET, UBX_MSGIDS
+
+from pygpsclient.ubx_handler import SVINFO_HDR, SVINFO_CHANNEL, MSGIDS_INT
+
+
+class UBXHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def testsvinfochannel(self):  # direct unpack must agree with pyubx2 decoding
+        msg = UBXMessage(b'\x01', b'\x30', GET, iTOW=403327000, numCh=2,
+                         chn_01=3, svid_01=12, flags_01=b'\x0d', quality_01=b'\x07',
+                         cno_01=38, elev_01=-5, azim_01=271, prRes_01=-1234,
+                         chn_02=9, svid_02=70, flags_02=b'\x01', quality_02=b'\x04',
+                         cno_02=0, elev_02=45, azim_02=-2, prRes_02=5678)
+        channels = msg.payload[SVINFO_HDR:]
+        res = list(SVINFO_CHANNEL.iter_unpack(channels))
+        exp = [tuple(getattr(msg, att + idx) for att in ('svid', 'cno', 'elev', 'azim'))
+               for idx in ('_01', '_02')]
+        self.assertEqual(res, exp)
+        self.assertEqual(res, [(12, 38, -5, 271), (70, 0, 45, -2)])
+
+    def testmsgidsint(self):  # integer keys must map one to one onto 2 byte ids
+        for key, identity in UBX_MSGIDS.items():
+            if len(key) == 2:
+                self.assertEqual(MSGIDS_INT[key[0] << 8 | key[1]], identity)
+        self.assertEqual(len(MSGIDS_INT), len([k for k in UBX_MSGIDS if len(k) == 2]))
+        self.assertNotIn(0x1360, MSGIDS_INT)  # MGA-ACK/NAK-DATA0 have 3 byte ids
+        self.assertEqual(MSGIDS_INT[0x0601], "CFG-MSG")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()